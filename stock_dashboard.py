@@ -1,14 +1,29 @@
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 import matplotlib.dates as mdates
 from matplotlib.patches import FancyBboxPatch
 import yfinance as yf
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+import hashlib
+import os
+import pickle
+import time
 import warnings
 warnings.filterwarnings("ignore")
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 
 WATCHLIST = {
     "Apple":     "AAPL",
@@ -39,9 +54,18 @@ SECTORS = {
     "Real Estate":  "XLRE",
 }
 
-PERIOD_1Y   = (datetime.today() - timedelta(days=365)).strftime("%Y-%m-%d")
-PERIOD_3M   = (datetime.today() - timedelta(days=90)).strftime("%Y-%m-%d")
-TODAY       = datetime.today().strftime("%Y-%m-%d")
+DAYS_1Y     = 365
+DAYS_3M     = 90
+MAX_WORKERS = 16
+DPI         = 100
+REFRESH_SECONDS = 0
+
+QUOTE_TICKERS = list(WATCHLIST.values()) + list(INDICES.values())
+HIST_TICKERS  = ["SPY", "AAPL", "TSLA", "NVDA"] + list(SECTORS.values())
+
+CACHE_DIR   = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+HIST_TTL    = 24 * 60 * 60
+QUOTE_TTL   = 5 * 60
 
 GREEN   = "#2ca02c"
 RED     = "#d62728"
@@ -53,22 +77,98 @@ PANEL   = "#161b22"
 TEXT    = "#e6edf3"
 MUTED   = "#8b949e"
 
+FMT_MON_YR = mdates.DateFormatter("%b '%y")
+FMT_MON    = mdates.DateFormatter("%b")
+
 
-def fetch_ticker(ticker, start, end=TODAY):
+def cache_path(key):
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".pkl")
+
+
+def cache_load(key, ttl):
+    path = cache_path(key)
     try:
-        df = yf.download(ticker, start=start, end=end, progress=False)
-        if df.empty:
+        if time.time() - os.path.getmtime(path) > ttl:
             return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def cache_prune(ttl):
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.endswith(".pkl") and time.time() - os.path.getmtime(path) > ttl:
+            os.remove(path)
+
+
+def cache_store(key, value):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        cache_prune(max(HIST_TTL, QUOTE_TTL))
+        with open(cache_path(key), "wb") as f:
+            pickle.dump(value, f)
+    except Exception:
+        pass
+
+
+def fetch_bulk(tickers, ttl, start=None, end=None, period=None):
+    key = f"{' '.join(tickers)}:{start or period}:{end}"
+    df  = cache_load(key, ttl)
+    if df is not None:
         return df
+    try:
+        df = yf.download(tickers, start=start, end=end, period=period, group_by="ticker",
+                         threads=MAX_WORKERS, progress=False)
+        if df.empty:
+            return None
+    except Exception:
+        return None
+    if bulk_complete(df, tickers):
+        cache_store(key, df)
+    return df
+
+
+def bulk_complete(df, tickers):
+    try:
+        return all(df[ticker]["Close"].notna().any() for ticker in tickers)
+    except Exception:
+        return False
+
+
+@dataclass
+class OHLCV:
+    dates:  np.ndarray
+    close:  np.ndarray
+    high:   np.ndarray
+    low:    np.ndarray
+    volume: np.ndarray
+
+
+def to_ohlcv(df):
+    return OHLCV(
+        dates  = mdates.date2num(df.index),
+        close  = df["Close"].squeeze().to_numpy(dtype=np.float32),
+        high   = df["High"].squeeze().to_numpy(dtype=np.float32),
+        low    = df["Low"].squeeze().to_numpy(dtype=np.float32),
+        volume = df["Volume"].squeeze().to_numpy(dtype=np.float32),
+    )
+
+
+def fetch_ticker(bulk, ticker, start):
+    try:
+        df = bulk[ticker].loc[start:].dropna(subset=["Close"])
+        if df.empty:
+            return None
+        return to_ohlcv(df)
     except Exception:
         return None
 
 
-def fetch_quote(ticker):
+def fetch_quote(bulk, ticker):
     try:
-        t    = yf.Ticker(ticker)
-        info = t.info
-        hist = t.history(period="2d")
+        hist = bulk[ticker].dropna(subset=["Close"])
         if len(hist) < 2:
             return None
         prev  = float(hist["Close"].iloc[-2])
@@ -82,109 +182,250 @@ def fetch_quote(ticker):
             "volume":  hist["Volume"].iloc[-1],
             "high":    float(hist["High"].iloc[-1]),
             "low":     float(hist["Low"].iloc[-1]),
-            "name":    info.get("shortName", ticker),
         }
     except Exception:
         return None
 
 
-def add_indicators(df):
-    close         = df["Close"].squeeze()
-    df            = df.copy()
-    df["MA20"]    = close.rolling(20).mean()
-    df["MA50"]    = close.rolling(50).mean()
-    df["EMA12"]   = close.ewm(span=12).mean()
-    df["EMA26"]   = close.ewm(span=26).mean()
-    df["MACD"]    = df["EMA12"] - df["EMA26"]
-    df["Signal"]  = df["MACD"].ewm(span=9).mean()
-    df["BB_mid"]  = close.rolling(20).mean()
-    df["BB_std"]  = close.rolling(20).std()
-    df["BB_up"]   = df["BB_mid"] + 2 * df["BB_std"]
-    df["BB_lo"]   = df["BB_mid"] - 2 * df["BB_std"]
-    delta         = close.diff()
-    gain          = delta.clip(lower=0).rolling(14).mean()
-    loss          = (-delta.clip(upper=0)).rolling(14).mean()
-    df["RSI"]     = 100 - (100 / (1 + gain / (loss + 1e-6)))
-    df["Volume_MA"] = df["Volume"].squeeze().rolling(20).mean()
-    return df
-
-
-def style_ax(ax, title="", ylabel=""):
+def _rolling_mean(arr, window):
+    out  = np.full(arr.shape[0], np.nan)
+    csum = np.concatenate(([0.0], np.cumsum(arr, dtype=float)))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+@njit(cache=True)
+def _compute_indicators(close):
+    n      = close.shape[0]
+    ma20   = np.full(n, np.nan)
+    ma50   = np.full(n, np.nan)
+    bb_std = np.full(n, np.nan)
+    rsi    = np.full(n, np.nan)
+    ema12  = np.empty(n)
+    ema26  = np.empty(n)
+    signal = np.empty(n)
+
+    # inputs may be float32; widen each read so the running sums stay float64
+    a12, a26, a9 = 2.0 / 13.0, 2.0 / 27.0, 2.0 / 10.0
+    e12 = e26 = np.float64(close[0]) if n > 0 else 0.0
+    sig = 0.0
+    sum20 = sq20 = sum50 = 0.0
+    gain14 = loss14 = 0.0
+
+    for i in range(n):
+        x = np.float64(close[i])
+
+        sum20 += x
+        sq20  += x * x
+        sum50 += x
+        if i >= 20:
+            old    = np.float64(close[i - 20])
+            sum20 -= old
+            sq20  -= old * old
+        if i >= 50:
+            sum50 -= np.float64(close[i - 50])
+        if i >= 19:
+            ma20[i]   = sum20 / 20
+            bb_std[i] = np.sqrt(max(sq20 - sum20 * sum20 / 20, 0.0) / 19)
+        if i >= 49:
+            ma50[i] = sum50 / 50
+
+        e12 = a12 * x + (1 - a12) * e12
+        e26 = a26 * x + (1 - a26) * e26
+        sig = a9 * (e12 - e26) + (1 - a9) * sig
+        ema12[i]  = e12
+        ema26[i]  = e26
+        signal[i] = sig
+
+        if i >= 1:
+            d       = x - np.float64(close[i - 1])
+            gain14 += max(d, 0.0)
+            loss14 += max(-d, 0.0)
+            if i >= 15:
+                d_old   = np.float64(close[i - 14]) - np.float64(close[i - 15])
+                gain14 -= max(d_old, 0.0)
+                loss14 -= max(-d_old, 0.0)
+            if i >= 14:
+                rsi[i] = 100 - (100 / (1 + (gain14 / 14) / (loss14 / 14 + 1e-6)))
+
+    return ma20, ma50, ema12, ema26, signal, bb_std, rsi
+
+
+def add_indicators(ohlcv):
+    ma20, ma50, ema12, ema26, signal, bb_std, rsi = _compute_indicators(ohlcv.close)
+    return {
+        "MA20":      ma20,
+        "MA50":      ma50,
+        "EMA12":     ema12,
+        "EMA26":     ema26,
+        "MACD":      ema12 - ema26,
+        "Signal":    signal,
+        "BB_mid":    ma20,
+        "BB_std":    bb_std,
+        "BB_up":     ma20 + 2 * bb_std,
+        "BB_lo":     ma20 - 2 * bb_std,
+        "RSI":       rsi,
+        "Volume_MA": _rolling_mean(ohlcv.volume, 20),
+    }
+
+
+def style_ax(ax, title="", ylabel="", fmt=FMT_MON_YR, interval=2, labelsize=8, dates=True):
     ax.set_facecolor(PANEL)
-    ax.tick_params(colors=MUTED, labelsize=8)
+    ax.tick_params(colors=MUTED, labelsize=labelsize)
     ax.spines[:].set_color("#30363d")
     if title:
         ax.set_title(title, color=TEXT, fontsize=9, fontweight="bold", pad=6)
     if ylabel:
         ax.set_ylabel(ylabel, color=MUTED, fontsize=8)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%b '%y"))
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-    plt.setp(ax.xaxis.get_majorticklabels(), rotation=30, ha="right")
+    if dates:
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(fmt)
+        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=interval))
+        plt.setp(ax.xaxis.get_majorticklabels(), rotation=30, ha="right")
 
 
-def plot_scorecard(ax, name, quote):
+def init_scorecard(ax, name):
     ax.set_facecolor(PANEL)
     ax.spines[:].set_color("#30363d")
     ax.set_xticks([])
     ax.set_yticks([])
-
+    return {
+        "name":  ax.text(0.5, 0.80, name, transform=ax.transAxes, ha="center", color=MUTED, fontsize=7),
+        "price": ax.text(0.5, 0.52, "", transform=ax.transAxes,
+                         ha="center", color=TEXT, fontsize=11, fontweight="bold"),
+        "chg":   ax.text(0.5, 0.24, "", transform=ax.transAxes, ha="center", fontsize=9),
+        "na":    ax.text(0.5, 0.5, "N/A", transform=ax.transAxes,
+                         ha="center", va="center", color=MUTED, fontsize=10),
+    }
+
+
+def plot_scorecard(card, quote):
+    for key in ("name", "price", "chg"):
+        card[key].set_visible(quote is not None)
+    card["na"].set_visible(quote is None)
     if quote is None:
-        ax.text(0.5, 0.5, "N/A", transform=ax.transAxes,
-                ha="center", va="center", color=MUTED, fontsize=10)
         return
 
     color  = GREEN if quote["change"] >= 0 else RED
     arrow  = "▲" if quote["change"] >= 0 else "▼"
     symbol = f"{arrow} {abs(quote['pct']):.2f}%"
 
-    ax.text(0.5, 0.80, name,        transform=ax.transAxes, ha="center", color=MUTED,  fontsize=7)
-    ax.text(0.5, 0.52, f"${quote['price']:,.2f}", transform=ax.transAxes,
-            ha="center", color=TEXT, fontsize=11, fontweight="bold")
-    ax.text(0.5, 0.24, symbol,      transform=ax.transAxes, ha="center", color=color,  fontsize=9)
+    card["price"].set_text(f"${quote['price']:,.2f}")
+    card["chg"].set_text(symbol)
+    card["chg"].set_color(color)
+
+
+def drop_artists(h, *keys):
+    for key in keys:
+        old = h.pop(key, None)
+        if isinstance(old, list):
+            for artist in old:
+                artist.remove()
+        elif old is not None:
+            old.remove()
+
+
+def plot_ranked_bars(panel, perf, fmt):
+    ax = panel["ax"]
+    drop_artists(panel, "bars", "labels")
+    if perf:
+        values, names = zip(*sorted(zip(perf.values(), perf.keys())))
+        colors = np.where(np.array(values) >= 0, GREEN, RED).tolist()
+        ypos   = np.arange(len(names))
+        panel["bars"]   = ax.barh(ypos, values, color=colors, alpha=0.85, height=0.6)
+        panel["labels"] = ax.bar_label(panel["bars"], labels=[fmt.format(v) for v in values],
+                                       padding=3, color=TEXT, fontsize=7)
+        ax.set_yticks(ypos)
+        ax.set_yticklabels(names)
+        ax.relim()
+        ax.autoscale(enable=True)
+    else:
+        ax.set_yticks([])
+        ax.set_xlim(-1, 1)
+
+
+def plot_price_panel(panel, df, legend=False):
+    ax = panel["ax"]
+    drop_artists(panel, "bb")
+    if df is None:
+        panel["close"].set_data([], [])
+        panel["ma20"].set_data([], [])
+        ax.relim()
+    else:
+        close = df["Close"]
+        dates = df["dates"]
+        color = GREEN if close[-1] >= close[0] else RED
+        panel["close"].set_data(dates, close)
+        panel["close"].set_color(color)
+        panel["ma20"].set_data(dates, df["MA20"])
+        ax.relim()
+        panel["bb"] = ax.fill_between(dates, df["BB_up"], df["BB_lo"], alpha=0.08, color=color)
+    ax.autoscale_view()
+    if legend:
+        ax.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
+
+
+def periods():
+    today = datetime.today()
+    return (
+        (today - timedelta(days=DAYS_1Y)).strftime("%Y-%m-%d"),
+        (today - timedelta(days=DAYS_3M)).strftime("%Y-%m-%d"),
+        today.strftime("%Y-%m-%d"),
+    )
 
 
-def build_dashboard():
+def fetch_data():
     print("Fetching market data...")
-
-    quotes     = {}
-    idx_quotes = {}
-
-    for name, ticker in WATCHLIST.items():
-        print(f"  {ticker}...")
-        quotes[name] = fetch_quote(ticker)
-
-    for name, ticker in INDICES.items():
-        print(f"  {ticker}...")
-        idx_quotes[name] = fetch_quote(ticker)
-
-    print("  Fetching historical data...")
-    spy_hist   = fetch_ticker("SPY",  PERIOD_1Y)
-    aapl_hist  = fetch_ticker("AAPL", PERIOD_3M)
-    tsla_hist  = fetch_ticker("TSLA", PERIOD_3M)
-    nvda_hist  = fetch_ticker("NVDA", PERIOD_3M)
+    period_1y, period_3m, today = periods()
+
+    print(f"  Downloading {len(QUOTE_TICKERS)} quotes...")
+    quote_bulk = fetch_bulk(QUOTE_TICKERS, QUOTE_TTL, period="5d")
+    print(f"  Downloading {len(HIST_TICKERS)} histories...")
+    bulk       = fetch_bulk(HIST_TICKERS, HIST_TTL, start=period_1y, end=today)
+
+    quotes     = {name: fetch_quote(quote_bulk, ticker) for name, ticker in WATCHLIST.items()}
+    idx_quotes = {name: fetch_quote(quote_bulk, ticker) for name, ticker in INDICES.items()}
+
+    windows = {"SPY": period_1y, "AAPL": period_3m, "TSLA": period_3m, "NVDA": period_3m}
+    ind     = {}
+    for ticker, start in windows.items():
+        ohlcv = fetch_ticker(bulk, ticker, period_1y)
+        if ohlcv is not None:
+            i    = np.searchsorted(ohlcv.dates, mdates.datestr2num(start))
+            if i >= len(ohlcv.dates):
+                continue
+            cols = {"dates": ohlcv.dates, "Close": ohlcv.close, **add_indicators(ohlcv)}
+            ind[ticker] = {key: arr[i:] for key, arr in cols.items()}
 
     sector_perf = {}
     for name, ticker in SECTORS.items():
-        df = fetch_ticker(ticker, PERIOD_3M)
-        if df is not None and len(df) > 1:
-            start_p = float(df["Close"].iloc[0])
-            end_p   = float(df["Close"].iloc[-1])
+        ohlcv = fetch_ticker(bulk, ticker, period_3m)
+        if ohlcv is not None and len(ohlcv.close) > 1:
+            start_p = float(ohlcv.close[0])
+            end_p   = float(ohlcv.close[-1])
             sector_perf[name] = (end_p - start_p) / start_p * 100
 
-    print("Building dashboard...")
+    return {
+        "quotes":      quotes,
+        "idx_quotes":  idx_quotes,
+        "ind":         ind,
+        "sector_perf": sector_perf,
+    }
 
+
+def build_dashboard():
     plt.rcParams.update({
         "figure.facecolor":  BG,
         "text.color":        TEXT,
         "font.family":       "monospace",
+        "path.simplify":     True,
+        "path.simplify_threshold": 1.0,
     })
 
     fig = plt.figure(figsize=(24, 18))
     fig.patch.set_facecolor(BG)
 
-    now_str = datetime.now().strftime("%B %d, %Y  %H:%M")
-    fig.suptitle(f"STOCK MARKET DASHBOARD  |  {now_str}",
-                 fontsize=15, fontweight="bold", color=TEXT, y=0.98)
+    title = fig.suptitle("", fontsize=15, fontweight="bold", color=TEXT, y=0.98)
 
     gs = gridspec.GridSpec(
         5, 8,
@@ -201,150 +442,128 @@ def build_dashboard():
     ax_rsi  = fig.add_subplot(gs[1, :3])
     ax_macd = fig.add_subplot(gs[2, :3])
 
-    if spy_hist is not None:
-        spy = add_indicators(spy_hist)
-        close = spy["Close"].squeeze()
-        dates = spy.index
-
-        ax_sp.plot(dates, close,        color=BLUE,  linewidth=1.5, label="SPY Close")
-        ax_sp.plot(dates, spy["MA20"],  color=GOLD,  linewidth=0.8, linestyle="--", label="MA20", alpha=0.8)
-        ax_sp.plot(dates, spy["MA50"],  color=RED,   linewidth=0.8, linestyle="--", label="MA50", alpha=0.8)
-        ax_sp.fill_between(dates, spy["BB_up"], spy["BB_lo"], alpha=0.08, color=BLUE)
-        ax_sp.set_facecolor(PANEL)
-        ax_sp.tick_params(colors=MUTED, labelsize=8)
-        ax_sp.spines[:].set_color("#30363d")
-        ax_sp.set_title("S&P 500 ETF (SPY) — 1 Year", color=TEXT, fontsize=9, fontweight="bold")
-        ax_sp.set_ylabel("Price ($)", color=MUTED, fontsize=8)
-        ax_sp.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
-        ax_sp.xaxis.set_major_formatter(mdates.DateFormatter("%b '%y"))
-        ax_sp.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax_sp.xaxis.get_majorticklabels(), rotation=30, ha="right")
-
-        ax_rsi.plot(dates, spy["RSI"], color=GOLD, linewidth=1)
-        ax_rsi.axhline(70, color=RED,   linestyle="--", linewidth=0.8, alpha=0.7)
-        ax_rsi.axhline(30, color=GREEN, linestyle="--", linewidth=0.8, alpha=0.7)
-        ax_rsi.fill_between(dates, spy["RSI"], 70, where=spy["RSI"] >= 70, alpha=0.2, color=RED)
-        ax_rsi.fill_between(dates, spy["RSI"], 30, where=spy["RSI"] <= 30, alpha=0.2, color=GREEN)
-        ax_rsi.set_ylim(0, 100)
-        ax_rsi.set_facecolor(PANEL)
-        ax_rsi.tick_params(colors=MUTED, labelsize=8)
-        ax_rsi.spines[:].set_color("#30363d")
-        ax_rsi.set_title("RSI (14)", color=TEXT, fontsize=9, fontweight="bold")
-        ax_rsi.set_ylabel("RSI", color=MUTED, fontsize=8)
-        ax_rsi.xaxis.set_major_formatter(mdates.DateFormatter("%b '%y"))
-        ax_rsi.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax_rsi.xaxis.get_majorticklabels(), rotation=30, ha="right")
-
-        macd_col = [GREEN if v >= 0 else RED for v in (spy["MACD"] - spy["Signal"])]
-        ax_macd.bar(dates, spy["MACD"] - spy["Signal"], color=macd_col, alpha=0.6, width=1.5)
-        ax_macd.plot(dates, spy["MACD"],   color=BLUE, linewidth=1,   label="MACD")
-        ax_macd.plot(dates, spy["Signal"], color=RED,  linewidth=0.8, label="Signal", linestyle="--")
-        ax_macd.set_facecolor(PANEL)
-        ax_macd.tick_params(colors=MUTED, labelsize=8)
-        ax_macd.spines[:].set_color("#30363d")
-        ax_macd.set_title("MACD", color=TEXT, fontsize=9, fontweight="bold")
-        ax_macd.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
-        ax_macd.xaxis.set_major_formatter(mdates.DateFormatter("%b '%y"))
-        ax_macd.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-        plt.setp(ax_macd.xaxis.get_majorticklabels(), rotation=30, ha="right")
-
-    idx_names = list(INDICES.keys())
-    for i, (name, ticker) in enumerate(INDICES.items()):
-        ax = fig.add_subplot(gs[0, 3 + i])
-        plot_scorecard(ax, name, idx_quotes.get(name))
+    h = {"fig": fig, "title": title, "ax_sp": ax_sp, "ax_rsi": ax_rsi, "ax_macd": ax_macd}
+
+    h["spy_close"], = ax_sp.plot([], [], color=BLUE, linewidth=1.5, label="SPY Close")
+    h["spy_ma20"],  = ax_sp.plot([], [], color=GOLD, linewidth=0.8, linestyle="--", label="MA20", alpha=0.8)
+    h["spy_ma50"],  = ax_sp.plot([], [], color=RED,  linewidth=0.8, linestyle="--", label="MA50", alpha=0.8)
+    style_ax(ax_sp, "S&P 500 ETF (SPY) — 1 Year", "Price ($)")
+    ax_sp.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
+
+    h["rsi"], = ax_rsi.plot([], [], color=GOLD, linewidth=1)
+    ax_rsi.axhline(70, color=RED,   linestyle="--", linewidth=0.8, alpha=0.7)
+    ax_rsi.axhline(30, color=GREEN, linestyle="--", linewidth=0.8, alpha=0.7)
+    ax_rsi.set_ylim(0, 100)
+    style_ax(ax_rsi, "RSI (14)", "RSI")
+
+    h["macd"],   = ax_macd.plot([], [], color=BLUE, linewidth=1,   label="MACD")
+    h["signal"], = ax_macd.plot([], [], color=RED,  linewidth=0.8, label="Signal", linestyle="--")
+    style_ax(ax_macd, "MACD")
+    ax_macd.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
 
+    h["idx_cards"] = {}
+    for i, name in enumerate(INDICES):
+        h["idx_cards"][name] = init_scorecard(fig.add_subplot(gs[0, 3 + i]), name)
+
+    h["cards"] = {}
     stock_names = list(WATCHLIST.keys())
     for i, name in enumerate(stock_names[:4]):
-        ax = fig.add_subplot(gs[1, 4 + i])
-        plot_scorecard(ax, name, quotes.get(name))
+        h["cards"][name] = init_scorecard(fig.add_subplot(gs[1, 4 + i]), name)
 
     for i, name in enumerate(stock_names[4:]):
-        ax = fig.add_subplot(gs[2, 4 + i])
-        plot_scorecard(ax, name, quotes.get(name))
+        h["cards"][name] = init_scorecard(fig.add_subplot(gs[2, 4 + i]), name)
 
     ax_sector = fig.add_subplot(gs[3, :4])
-    if sector_perf:
-        names  = list(sector_perf.keys())
-        values = list(sector_perf.values())
-        colors = [GREEN if v >= 0 else RED for v in values]
-        sorted_pairs = sorted(zip(values, names, colors))
-        values, names, colors = zip(*sorted_pairs)
-        bars = ax_sector.barh(names, values, color=colors, alpha=0.85, height=0.6)
-        ax_sector.axvline(0, color=MUTED, linewidth=1)
-        ax_sector.set_facecolor(PANEL)
-        ax_sector.tick_params(colors=MUTED, labelsize=8)
-        ax_sector.spines[:].set_color("#30363d")
-        ax_sector.set_title("Sector Performance — 3 Months (%)", color=TEXT, fontsize=9, fontweight="bold")
-        for bar, val in zip(bars, values):
-            ax_sector.text(val + (0.1 if val >= 0 else -0.1), bar.get_y() + bar.get_height() / 2,
-                           f"{val:+.1f}%", va="center",
-                           ha="left" if val >= 0 else "right",
-                           color=TEXT, fontsize=7)
-
-    stock_pairs = [("AAPL", aapl_hist), ("TSLA", tsla_hist), ("NVDA", nvda_hist)]
-    col_starts  = [4, 6, 4]
-
-    for idx2, (ticker, hist) in enumerate(stock_pairs[:2]):
+    ax_sector.axvline(0, color=MUTED, linewidth=1)
+    style_ax(ax_sector, "Sector Performance — 3 Months (%)", dates=False)
+    h["sector"] = {"ax": ax_sector}
+
+    h["stocks"] = {}
+    for idx2, ticker in enumerate(["AAPL", "TSLA"]):
         ax = fig.add_subplot(gs[3, 4 + idx2 * 2: 4 + idx2 * 2 + 2])
-        if hist is not None:
-            df2   = add_indicators(hist)
-            close = df2["Close"].squeeze()
-            dates = df2.index
-            color = GREEN if float(close.iloc[-1]) >= float(close.iloc[0]) else RED
-            ax.plot(dates, close,         color=color, linewidth=1.5)
-            ax.plot(dates, df2["MA20"],   color=GOLD,  linewidth=0.8, linestyle="--", alpha=0.7)
-            ax.fill_between(dates, df2["BB_up"], df2["BB_lo"], alpha=0.08, color=color)
-            ax.set_facecolor(PANEL)
-            ax.tick_params(colors=MUTED, labelsize=7)
-            ax.spines[:].set_color("#30363d")
-            ax.set_title(f"{ticker} — 3M", color=TEXT, fontsize=9, fontweight="bold")
-            ax.xaxis.set_major_formatter(mdates.DateFormatter("%b"))
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=30, ha="right")
+        close, = ax.plot([], [], linewidth=1.5)
+        ma20,  = ax.plot([], [], color=GOLD, linewidth=0.8, linestyle="--", alpha=0.7)
+        style_ax(ax, f"{ticker} — 3M", fmt=FMT_MON, interval=1, labelsize=7)
+        h["stocks"][ticker] = {"ax": ax, "close": close, "ma20": ma20}
 
     ax_nvda = fig.add_subplot(gs[4, :4])
-    if nvda_hist is not None:
-        df2   = add_indicators(nvda_hist)
-        close = df2["Close"].squeeze()
-        dates = df2.index
-        color = GREEN if float(close.iloc[-1]) >= float(close.iloc[0]) else RED
-        ax_nvda.plot(dates, close,       color=color, linewidth=1.5, label="NVDA")
-        ax_nvda.plot(dates, df2["MA20"], color=GOLD,  linewidth=0.8, linestyle="--", label="MA20", alpha=0.7)
-        ax_nvda.fill_between(dates, df2["BB_up"], df2["BB_lo"], alpha=0.08, color=color)
-        ax_nvda.set_facecolor(PANEL)
-        ax_nvda.tick_params(colors=MUTED, labelsize=8)
-        ax_nvda.spines[:].set_color("#30363d")
-        ax_nvda.set_title("NVDA — 3 Months with Bollinger Bands", color=TEXT, fontsize=9, fontweight="bold")
-        ax_nvda.legend(fontsize=7, facecolor=PANEL, edgecolor="#30363d", labelcolor=TEXT)
-        ax_nvda.xaxis.set_major_formatter(mdates.DateFormatter("%b '%y"))
-        ax_nvda.xaxis.set_major_locator(mdates.MonthLocator())
-        plt.setp(ax_nvda.xaxis.get_majorticklabels(), rotation=30, ha="right")
+    close, = ax_nvda.plot([], [], linewidth=1.5, label="NVDA")
+    ma20,  = ax_nvda.plot([], [], color=GOLD, linewidth=0.8, linestyle="--", label="MA20", alpha=0.7)
+    style_ax(ax_nvda, "NVDA — 3 Months with Bollinger Bands", interval=1)
+    h["stocks"]["NVDA"] = {"ax": ax_nvda, "close": close, "ma20": ma20}
 
     ax_vol = fig.add_subplot(gs[4, 4:])
-    winners = {k: v for k, v in quotes.items() if v is not None}
-    if winners:
-        names  = list(winners.keys())
-        pcts   = [winners[n]["pct"] for n in names]
-        colors = [GREEN if p >= 0 else RED for p in pcts]
-        sorted_pairs = sorted(zip(pcts, names, colors))
-        pcts, names, colors = zip(*sorted_pairs)
-        bars = ax_vol.barh(names, pcts, color=colors, alpha=0.85, height=0.6)
-        ax_vol.axvline(0, color=MUTED, linewidth=1)
-        ax_vol.set_facecolor(PANEL)
-        ax_vol.tick_params(colors=MUTED, labelsize=8)
-        ax_vol.spines[:].set_color("#30363d")
-        ax_vol.set_title("Watchlist Daily Change (%)", color=TEXT, fontsize=9, fontweight="bold")
-        for bar, val in zip(bars, pcts):
-            ax_vol.text(val + (0.02 if val >= 0 else -0.02),
-                        bar.get_y() + bar.get_height() / 2,
-                        f"{val:+.2f}%", va="center",
-                        ha="left" if val >= 0 else "right",
-                        color=TEXT, fontsize=7)
-
-    plt.savefig("stock_dashboard.png", dpi=150, bbox_inches="tight",
-                facecolor=BG, edgecolor="none")
-    print("Dashboard saved as stock_dashboard.png")
-    plt.show()
-
-
-build_dashboard()
+    ax_vol.axvline(0, color=MUTED, linewidth=1)
+    style_ax(ax_vol, "Watchlist Daily Change (%)", dates=False)
+    h["watchlist"] = {"ax": ax_vol}
+
+    return h
+
+
+def update_dashboard(h, data):
+    ind = data["ind"]
+
+    now_str = datetime.now().strftime("%B %d, %Y  %H:%M")
+    h["title"].set_text(f"STOCK MARKET DASHBOARD  |  {now_str}")
+
+    ax_sp, ax_rsi, ax_macd = h["ax_sp"], h["ax_rsi"], h["ax_macd"]
+    drop_artists(h, "spy_bb", "rsi_hi", "rsi_lo", "macd_bars")
+
+    spy = ind.get("SPY")
+    if spy is not None:
+        dates    = spy["dates"]
+        hist_bar = spy["MACD"] - spy["Signal"]
+        macd_col = np.where(hist_bar >= 0, GREEN, RED).tolist()
+
+        h["spy_close"].set_data(dates, spy["Close"])
+        h["spy_ma20"].set_data(dates, spy["MA20"])
+        h["spy_ma50"].set_data(dates, spy["MA50"])
+        h["rsi"].set_data(dates, spy["RSI"])
+        h["macd"].set_data(dates, spy["MACD"])
+        h["signal"].set_data(dates, spy["Signal"])
+        for ax in (ax_sp, ax_rsi, ax_macd):
+            ax.relim()
+
+        h["spy_bb"]    = ax_sp.fill_between(dates, spy["BB_up"], spy["BB_lo"], alpha=0.08, color=BLUE)
+        h["rsi_hi"]    = ax_rsi.fill_between(dates, spy["RSI"], 70, where=spy["RSI"] >= 70, alpha=0.2, color=RED)
+        h["rsi_lo"]    = ax_rsi.fill_between(dates, spy["RSI"], 30, where=spy["RSI"] <= 30, alpha=0.2, color=GREEN)
+        h["macd_bars"] = ax_macd.bar(dates, hist_bar, color=macd_col, alpha=0.6, width=1.5)
+    else:
+        for key in ("spy_close", "spy_ma20", "spy_ma50", "rsi", "macd", "signal"):
+            h[key].set_data([], [])
+        for ax in (ax_sp, ax_rsi, ax_macd):
+            ax.relim()
+    for ax in (ax_sp, ax_rsi, ax_macd):
+        ax.autoscale_view()
+
+    for name, card in h["idx_cards"].items():
+        plot_scorecard(card, data["idx_quotes"].get(name))
+
+    for name, card in h["cards"].items():
+        plot_scorecard(card, data["quotes"].get(name))
+
+    plot_ranked_bars(h["sector"], data["sector_perf"], "{:+.1f}%")
+
+    for ticker, panel in h["stocks"].items():
+        plot_price_panel(panel, ind.get(ticker), legend=ticker == "NVDA")
+
+    winners = {k: v["pct"] for k, v in data["quotes"].items() if v is not None}
+    plot_ranked_bars(h["watchlist"], winners, "{:+.2f}%")
+
+
+def main():
+    h = None
+    while True:
+        data = fetch_data()
+        if h is None:
+            print("Building dashboard...")
+            h = build_dashboard()
+        update_dashboard(h, data)
+        h["fig"].savefig("stock_dashboard.png", dpi=DPI, facecolor=BG, edgecolor="none")
+        print("Dashboard saved as stock_dashboard.png")
+        if not REFRESH_SECONDS:
+            break
+        time.sleep(REFRESH_SECONDS)
+
+
+main()